@@ -85,3 +85,28 @@ def test_parse_nonexistent_file():
         FileNotFoundError, match=f"Configuration file '{config_path}' not found."
     ):
         parse_config_file(config_path)
+
+
+def test_parse_modified_config():
+    """
+    Test that parse_config_file reads a configuration file again after it changes.
+
+    GIVEN: A valid `.ini` file that is parsed once and then rewritten with a newer mtime.
+    WHEN: The parse_config_file function is called again with the same path.
+    THEN: It should return the new values, and a modified result must not leak into later calls.
+    """
+    config_path = create_temp_ini("[Simulation]\nnumwalkers = 5000\n")
+
+    first_result = parse_config_file(config_path)
+    first_result["numwalkers"] = 1
+    assert parse_config_file(config_path) == {"numwalkers": 5000}
+
+    with open(config_path, "w") as config_file:
+        config_file.write("[Simulation]\nnumwalkers = 100\n")
+    mtime = os.path.getmtime(config_path) + 10
+    os.utime(config_path, (mtime, mtime))
+
+    result = parse_config_file(config_path)
+    assert result == {"numwalkers": 100}, f"Expected the updated value, but got {result}"
+
+    os.remove(config_path)
@@ -1,9 +1,28 @@
+from unittest.mock import patch
 import numpy as np
+import pytest
 from vmc_simulation.simulation import dE_dalpha
 from vmc_simulation.simulation import local_energy_func
 
 
-def test_output_is_scalar():
+@pytest.fixture(scope="module")
+def x_standard():
+    """
+    Standard grid of valid positions shared by the tests of this module.
+    """
+    return np.linspace(0.5, 3, 100)
+
+
+def expected_dE_dalpha(x_values, alpha):
+    """
+    Reference value of dE/dα from the covariance formula with ln_wf = -x.
+    """
+    El = local_energy_func(x_values, alpha)
+    ln_wf = -x_values
+    return 2 * (np.mean(El * ln_wf) - np.mean(El) * np.mean(ln_wf))
+
+
+def test_output_is_scalar(x_standard):
     """
     Test that dE_dalpha returns a scalar value.
 
@@ -11,7 +30,7 @@ def test_output_is_scalar():
     WHEN: The function is called.
     THEN: The output should be a single scalar value.
     """
-    x_values = np.linspace(0.5, 3, 100)
+    x_values = x_standard
     alpha = 1.0
     result = dE_dalpha(x_values, alpha)
 
@@ -29,9 +48,7 @@ def test_typical_values():
     x_values = np.array([1.0, 2.0, 3.0])
     alpha = 1.0
 
-    El = local_energy_func(x_values, alpha)
-    ln_wf = -x_values
-    expected_value = 2 * (np.mean(El * ln_wf) - np.mean(El) * np.mean(ln_wf))
+    expected_value = expected_dE_dalpha(x_values, alpha)
     result = dE_dalpha(x_values, alpha)
 
     assert np.isfinite(
@@ -42,7 +59,7 @@ def test_typical_values():
     ), f"Expected {expected_value}, got {result}"
 
 
-def test_small_positive_alpha():
+def test_small_positive_alpha(x_standard):
     """
     Test dE_dalpha behavior with a very small positive alpha value.
 
@@ -50,12 +67,10 @@ def test_small_positive_alpha():
     WHEN: The function is called.
     THEN: The function should return a finite number.
     """
-    x_values = np.linspace(0.5, 3, 100)
+    x_values = x_standard
     alpha = 1e-10
 
-    El = local_energy_func(x_values, alpha)
-    ln_wf = -x_values
-    expected_value = 2 * (np.mean(El * ln_wf) - np.mean(El) * np.mean(ln_wf))
+    expected_value = expected_dE_dalpha(x_values, alpha)
     result = dE_dalpha(x_values, alpha)
 
     assert np.isfinite(
@@ -66,7 +81,7 @@ def test_small_positive_alpha():
     ), f"Expected {expected_value}, got {result}"
 
 
-def test_large_positive_alpha():
+def test_large_positive_alpha(x_standard):
     """
     Test dE_dalpha does not overflow with a very large alpha value.
 
@@ -74,13 +89,11 @@ def test_large_positive_alpha():
     WHEN: The function is called.
     THEN: The function should return a finite number without overflow.
     """
-    x_values = np.linspace(0.5, 3, 100)
+    x_values = x_standard
     alpha = 1000
     result = dE_dalpha(x_values, alpha)
 
-    El = local_energy_func(x_values, alpha)
-    ln_wf = -x_values
-    expected_value = 2 * (np.mean(El * ln_wf) - np.mean(El) * np.mean(ln_wf))
+    expected_value = expected_dE_dalpha(x_values, alpha)
 
     assert np.isfinite(result), "dE_dalpha should not overflow for large alpha."
     assert np.isclose(
@@ -99,9 +112,7 @@ def test_small_negative_alpha():
     x_values = np.linspace(2, 3, 100)
     alpha = -1e-10
 
-    El = local_energy_func(x_values, alpha)
-    ln_wf = -x_values
-    expected_value = 2 * (np.mean(El * ln_wf) - np.mean(El) * np.mean(ln_wf))
+    expected_value = expected_dE_dalpha(x_values, alpha)
     result = dE_dalpha(x_values, alpha)
 
     assert np.isfinite(
@@ -123,9 +134,7 @@ def test_small_positive_x():
     x_values = np.array([1e-10, 1e-8, 1e-5])
     alpha = 1.0
 
-    El = local_energy_func(x_values, alpha)
-    ln_wf = -x_values
-    expected_value = 2 * (np.mean(El * ln_wf) - np.mean(El) * np.mean(ln_wf))
+    expected_value = expected_dE_dalpha(x_values, alpha)
     result = dE_dalpha(x_values, alpha)
 
     assert np.isfinite(
@@ -147,12 +156,115 @@ def test_large_x_values():
     x_values = np.array([1e6, 1e8, 1e10])
     alpha = 1.0
 
-    El = local_energy_func(x_values, alpha)
-    ln_wf = -x_values
-    expected_value = 2 * (np.mean(El * ln_wf) - np.mean(El) * np.mean(ln_wf))
+    expected_value = expected_dE_dalpha(x_values, alpha)
     result = dE_dalpha(x_values, alpha)
 
     assert np.isfinite(result), "dE_dalpha should not overflow for large x values."
     assert np.isclose(
         result, expected_value, atol=1e-10
     ), f"Expected {expected_value}, got {result}"
+
+
+def test_numpy_fallback_matches(x_standard):
+    """
+    Test that the compiled and the pure NumPy dE_dalpha agree.
+
+    GIVEN: An array of valid positions x and a valid alpha.
+    WHEN: dE_dalpha is called with and without numba.
+    THEN: Both results should be the same up to rounding.
+    """
+    x_values = x_standard
+    alpha = 0.8
+
+    result = dE_dalpha(x_values, alpha)
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+        expected_value = dE_dalpha(x_values, alpha)
+
+    assert np.isclose(
+        result, expected_value, atol=1e-10
+    ), f"Expected {expected_value}, got {result}"
+
+
+def test_multidimensional_input(x_standard):
+    """
+    Test that dE_dalpha reduces over every element of a multi-dimensional array.
+
+    GIVEN: A 2-D array of valid positions and a valid alpha.
+    WHEN: The function is called.
+    THEN: The result should equal the one for the flattened array.
+    """
+    x_values = x_standard.reshape(10, 10)
+    alpha = 0.8
+
+    result = dE_dalpha(x_values, alpha)
+    expected_value = dE_dalpha(x_values.ravel(), alpha)
+
+    assert np.isclose(
+        result, expected_value, atol=1e-10
+    ), f"Expected {expected_value}, got {result}"
+
+
+def test_returns_python_float(x_standard):
+    """
+    Test that dE_dalpha returns a plain Python float with and without numba.
+
+    GIVEN: An array of valid positions x and a valid alpha.
+    WHEN: dE_dalpha is called with and without numba.
+    THEN: Both results should be Python floats, not NumPy scalars or 0-d arrays.
+    """
+    x_values = x_standard
+    alpha = 0.8
+
+    result = dE_dalpha(x_values, alpha)
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+        fallback_result = dE_dalpha(x_values, alpha)
+
+    assert type(result) is float, f"Expected a Python float, got {type(result)}"
+    assert (
+        type(fallback_result) is float
+    ), f"Expected a Python float, got {type(fallback_result)}"
+
+
+def test_exact_wavefunction_alpha(x_standard):
+    """
+    Test that dE_dalpha vanishes for alpha = 1, where the local energy is constant.
+
+    GIVEN: An array of valid positions x and alpha = 1.
+    WHEN: dE_dalpha is called with and without numba.
+    THEN: Both results should be exactly 0.
+    """
+    x_values = x_standard
+    alpha = 1.0
+
+    result = dE_dalpha(x_values, alpha)
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+        fallback_result = dE_dalpha(x_values, alpha)
+
+    assert result == 0.0, f"Expected 0.0, got {result}"
+    assert fallback_result == 0.0, f"Expected 0.0, got {fallback_result}"
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize(
+    "x_values",
+    [np.array([0.0, 1.0, 2.0]), np.array([np.nan, 1.0, 2.0]), np.array([])],
+    ids=["zero", "nan", "empty"],
+)
+def test_invalid_positions_give_nan(x_values):
+    """
+    Test that the compiled and fallback dE_dalpha agree on invalid positions.
+
+    GIVEN: Positions containing 0 or NaN, or no positions at all.
+    WHEN: dE_dalpha is called with and without numba.
+    THEN: Both results should be NaN instead of raising an error.
+    """
+    alpha = 0.8
+
+    result = dE_dalpha(x_values, alpha)
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+        fallback_result = dE_dalpha(x_values, alpha)
+
+    assert np.isnan(result), f"Expected nan from the compiled path, got {result}"
+    assert np.isnan(
+        fallback_result
+    ), f"Expected nan from the NumPy fallback, got {fallback_result}"
@@ -1,3 +1,4 @@
+from unittest.mock import patch
 import numpy as np
 from vmc_simulation.simulation import local_energy_func
 
@@ -172,3 +173,66 @@ def test_negative_x_values():
     assert np.allclose(
         result, expected_values, atol=1e-10
     ), "The function output does not match expected values for negative x."
+
+
+def test_numpy_fallback_matches():
+    """
+    Test that the compiled and the pure NumPy local_energy_func agree.
+
+    GIVEN: A set of standard positive x values and a valid alpha.
+    WHEN: local_energy_func is called with and without numba.
+    THEN: Both results should be the same up to rounding.
+    """
+    x_values = np.linspace(0.5, 5.0, num=100)
+    alpha = 0.8
+
+    result = local_energy_func(x_values, alpha)
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+        expected_values = local_energy_func(x_values, alpha)
+
+    assert np.allclose(
+        result, expected_values, atol=1e-10
+    ), f"Expected {expected_values}, got {result}"
+
+
+def test_non_contiguous_multidimensional_input():
+    """
+    Test that local_energy_func keeps the shape of strided multi-dimensional input.
+
+    GIVEN: A non-contiguous 2-D view of valid positions and a valid alpha.
+    WHEN: The function is called.
+    THEN: The result should have the input shape and match the elementwise formula.
+    """
+    x_values = np.linspace(0.5, 5.0, num=200).reshape(10, 20)[:, ::2]
+    alpha = 0.8
+
+    result = local_energy_func(x_values, alpha)
+    expected_values = (alpha - 1.0) / x_values - 0.5 * alpha**2
+
+    assert result.shape == x_values.shape, "The output shape differs from the input."
+    assert np.allclose(
+        result, expected_values, atol=1e-10
+    ), f"Expected {expected_values}, got {result}"
+
+
+def test_zero_and_nan_positions_match_fallback():
+    """
+    Test that the compiled and fallback local energies agree on x = 0 and NaN.
+
+    GIVEN: Positions containing 0 and NaN next to a valid position.
+    WHEN: local_energy_func is called with and without numba.
+    THEN: Both should give an infinite entry for x = 0 and NaN for the NaN position.
+    """
+    x_values = np.array([0.0, np.nan, 1.0])
+    alpha = 0.5
+
+    with np.errstate(divide="ignore"):
+        result = local_energy_func(x_values, alpha)
+        with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+            expected_output = local_energy_func(x_values, alpha)
+
+    assert np.isinf(result[0]), "The local energy should be infinite at x = 0."
+    assert np.isnan(result[1]), "The local energy should be NaN for a NaN position."
+    assert np.array_equal(
+        result, expected_output, equal_nan=True
+    ), "The compiled and NumPy local energies differ for x = 0 or NaN."
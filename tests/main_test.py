@@ -0,0 +1,58 @@
+from unittest.mock import patch
+import numpy as np
+from vmc_simulation.main import main
+
+
+def test_command_line_overrides_config_and_defaults(tmp_path):
+    """
+    Test the precedence command line > config file > defaults of main.
+
+    GIVEN: A config file setting some parameters, and a command line overriding a
+    subset of them, including dashed options in both the "--opt value" and the
+    "--opt=value" forms.
+    WHEN: main is run with metropolis and the output functions patched.
+    THEN: metropolis should receive the command-line values where given, the config
+    values otherwise, and the defaults for parameters set by neither, and the
+    results should be saved to the output directory from the command line.
+    """
+    config_path = tmp_path / "simulation.ini"
+    config_path.write_text(
+        "[Simulation]\n"
+        "numwalkers = 500\n"
+        "alpha = 0.9\n"
+        "learning_rate = 0.05\n"
+        "step_size = 0.2\n"
+        "output_dir = config_results\n"
+    )
+    output_dir = str(tmp_path / "cli_results")
+    argv = [
+        "main.py",
+        "--config",
+        str(config_path),
+        "--numwalkers",
+        "10",
+        "--learning-rate=0.2",
+        "--output-dir",
+        output_dir,
+    ]
+    results = (np.ones(10), 1.0, np.ones(3), np.ones(3), np.zeros(3), np.ones(10))
+
+    with patch("sys.argv", argv), patch(
+        "vmc_simulation.main.metropolis", return_value=results
+    ) as mock_metropolis, patch(
+        "vmc_simulation.main.save_results_to_csv"
+    ) as mock_save, patch(
+        "vmc_simulation.main.plot_position"
+    ), patch(
+        "vmc_simulation.main.plot_alpha_evolution"
+    ), patch(
+        "vmc_simulation.main.plot_energy_evolution"
+    ):
+        main()
+
+    # equilibration_steps and numsteps keep their defaults, numwalkers and
+    # learning_rate come from the command line, alpha and step_size from the config.
+    mock_metropolis.assert_called_once_with(3000, 120, 10, 0.9, 0.2, 0.2)
+    assert (
+        mock_save.call_args.args[3] == output_dir
+    ), "--output-dir should override the config file."
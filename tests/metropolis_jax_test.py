@@ -0,0 +1,141 @@
+from unittest.mock import patch
+import numpy as np
+import pytest
+from vmc_simulation.simulation_jax import metropolis_jax
+
+
+def test_output_shapes():
+    """
+    Test that metropolis_jax returns one row per chain.
+
+    GIVEN: Two chains with reasonable parameters.
+    WHEN: The metropolis_jax function is called.
+    THEN: Every returned array should have one row per chain.
+    """
+    pytest.importorskip("jax")
+    np.random.seed(42)
+    n_chains = 2
+    numsteps = 5
+    numwalkers = 100
+
+    position_vecs, alpha_fin, alpha_buffers, E_buffers, E_chain_var, E_pooled_var = (
+        metropolis_jax(n_chains, 20, numsteps, numwalkers, 0.8, 0.01, 0.1)
+    )
+
+    assert position_vecs.shape == (n_chains, numwalkers)
+    assert alpha_fin.shape == (n_chains,)
+    assert alpha_buffers.shape == (n_chains, numsteps)
+    assert E_buffers.shape == (n_chains, numsteps)
+    assert E_chain_var.shape == (n_chains,)
+    assert np.isfinite(E_pooled_var), "Pooled variance is not finite."
+    assert np.all(position_vecs > 0), "Some walker positions are non-physical (≤ 0)."
+
+
+def test_alpha_convergence():
+    """
+    Test that every JAX chain optimizes alpha towards the exact value.
+
+    GIVEN: Reasonable parameters for two chains.
+    WHEN: The metropolis_jax function is run for sufficient steps.
+    THEN: The final alpha of every chain should be close to 1 and its energy close to -1/2.
+    """
+    pytest.importorskip("jax")
+    np.random.seed(42)
+
+    _, alpha_fin, _, E_buffers, _, _ = metropolis_jax(2, 100, 50, 1000, 0.8, 0.01, 0.1)
+
+    assert np.all(
+        np.abs(alpha_fin - 1.0) < 0.05
+    ), f"Expected alpha close to 1, got {alpha_fin}"
+    assert np.all(
+        np.abs(E_buffers[:, -1] + 0.5) < 0.01
+    ), f"Expected energies close to -1/2, got {E_buffers[:, -1]}"
+
+
+def test_chains_reproducible():
+    """
+    Test that metropolis_jax is reproducible through np.random.seed.
+
+    GIVEN: The same global seed before two calls with the same parameters.
+    WHEN: The metropolis_jax function is called twice.
+    THEN: Both calls return identical positions, and the chains differ from each other.
+    """
+    pytest.importorskip("jax")
+    np.random.seed(42)
+    position_vecs_1, _, _, _, _, _ = metropolis_jax(2, 20, 3, 50, 0.8, 0.01, 0.1)
+    np.random.seed(42)
+    position_vecs_2, _, _, _, _, _ = metropolis_jax(2, 20, 3, 50, 0.8, 0.01, 0.1)
+
+    assert np.array_equal(
+        position_vecs_1, position_vecs_2
+    ), "Walker positions differ between runs with the same seed."
+    assert not np.array_equal(
+        position_vecs_1[0], position_vecs_1[1]
+    ), "Chains should not share the same random stream."
+
+
+@pytest.mark.parametrize("invalid_value", [0, -1])
+def test_invalid_n_chains_value(invalid_value):
+    """
+    Test that metropolis_jax raises a ValueError for zero or negative n_chains.
+
+    GIVEN: A zero or negative value for n_chains.
+    WHEN: The metropolis_jax function is called.
+    THEN: A ValueError should be raised.
+    """
+    with pytest.raises(ValueError, match="n_chains must be a positive integer."):
+        metropolis_jax(invalid_value, 20, 3, 50, 0.8, 0.01, 0.1)
+
+
+def test_invalid_sampling_parameters():
+    """
+    Test that metropolis_jax validates the sampling parameters like metropolis.
+
+    GIVEN: A non-integer number of walkers.
+    WHEN: The metropolis_jax function is called.
+    THEN: A TypeError should be raised with the metropolis error message.
+    """
+    pytest.importorskip("jax")
+
+    with pytest.raises(
+        TypeError,
+        match="equilibration_steps, numsteps, and numwalkers must be integers.",
+    ):
+        metropolis_jax(2, 20, 3, 50.5, 0.8, 0.01, 0.1)
+
+
+@pytest.mark.parametrize(
+    "invalid_alpha, error, message",
+    [
+        ("0.8", TypeError, "Alpha must be a real number."),
+        (500.0, ValueError, "Too large alpha causes numerical instability."),
+    ],
+)
+def test_invalid_alpha(invalid_alpha, error, message):
+    """
+    Test that metropolis_jax validates alpha like metropolis.
+
+    GIVEN: An alpha that is a string, or too large to be sampled stably.
+    WHEN: The metropolis_jax function is called.
+    THEN: The error raised by metropolis should be raised with the same message.
+    """
+    pytest.importorskip("jax")
+
+    with pytest.raises(error, match=message):
+        metropolis_jax(1, 5, 2, 10, invalid_alpha, 0.01, 0.1)
+
+
+def test_fallback_without_jax():
+    """
+    Test that metropolis_jax falls back to metropolis_parallel without JAX.
+
+    GIVEN: JAX reported as unavailable.
+    WHEN: The metropolis_jax function is called.
+    THEN: The chains should be run by metropolis_parallel with the same arguments.
+    """
+    with patch("vmc_simulation.simulation_jax.JAX_AVAILABLE", False), patch(
+        "vmc_simulation.simulation_jax.metropolis_parallel"
+    ) as mock_parallel:
+        metropolis_jax(2, 20, 3, 50, 0.8, 0.01, 0.1)
+
+    mock_parallel.assert_called_once_with(2, 20, 3, 50, 0.8, 0.01, 0.1)
@@ -0,0 +1,142 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import numpy as np
+import pytest
+from vmc_simulation.simulation import metropolis_parallel
+
+
+def test_output_shapes():
+    """
+    Test that metropolis_parallel stacks the results of every chain.
+
+    GIVEN: Two chains with reasonable parameters.
+    WHEN: The metropolis_parallel function is called.
+    THEN: Every returned array should have one row per chain.
+    """
+    np.random.seed(42)
+    n_chains = 2
+    numsteps = 5
+    numwalkers = 100
+
+    position_vecs, alpha_fin, alpha_buffers, E_buffers, E_chain_var, E_pooled_var = (
+        metropolis_parallel(n_chains, 20, numsteps, numwalkers, 0.8, 0.01, 0.1)
+    )
+
+    assert position_vecs.shape == (n_chains, numwalkers)
+    assert alpha_fin.shape == (n_chains,)
+    assert alpha_buffers.shape == (n_chains, numsteps)
+    assert E_buffers.shape == (n_chains, numsteps)
+    assert E_chain_var.shape == (n_chains,)
+    assert np.isfinite(E_pooled_var), "Pooled variance is not finite."
+    assert np.all(position_vecs > 0), "Some walker positions are non-physical (≤ 0)."
+
+
+def test_chains_are_independent():
+    """
+    Test that metropolis_parallel gives each chain its own random stream.
+
+    GIVEN: Two chains started from the same alpha.
+    WHEN: The metropolis_parallel function is called.
+    THEN: The final walker positions of the two chains should differ.
+    """
+    np.random.seed(42)
+
+    position_vecs, _, _, _, _, _ = metropolis_parallel(2, 20, 3, 50, 0.8, 0.01, 0.1)
+
+    assert not np.array_equal(
+        position_vecs[0], position_vecs[1]
+    ), "Chains should not share the same random stream."
+
+
+@pytest.mark.parametrize("invalid_value", ["string", 2.5, [], {}])
+def test_invalid_n_chains_type(invalid_value):
+    """
+    Test that metropolis_parallel raises a TypeError for a non-integer n_chains.
+
+    GIVEN: A non-integer value for n_chains.
+    WHEN: The metropolis_parallel function is called.
+    THEN: A TypeError should be raised.
+    """
+    with pytest.raises(TypeError, match="n_chains must be an integer."):
+        metropolis_parallel(invalid_value, 20, 3, 50, 0.8, 0.01, 0.1)
+
+
+@pytest.mark.parametrize("invalid_value", [0, -1])
+def test_invalid_n_chains_value(invalid_value):
+    """
+    Test that metropolis_parallel raises a ValueError for zero or negative n_chains.
+
+    GIVEN: A zero or negative value for n_chains.
+    WHEN: The metropolis_parallel function is called.
+    THEN: A ValueError should be raised.
+    """
+    with pytest.raises(ValueError, match="n_chains must be a positive integer."):
+        metropolis_parallel(invalid_value, 20, 3, 50, 0.8, 0.01, 0.1)
+
+
+def test_chains_reproducible():
+    """
+    Test that metropolis_parallel is reproducible through np.random.seed.
+
+    GIVEN: The same global seed before two calls with the same parameters.
+    WHEN: The metropolis_parallel function is called twice.
+    THEN: Both calls return identical positions and alpha buffers for every chain.
+    """
+    np.random.seed(42)
+    position_vecs_1, _, alpha_buffers_1, _, _, _ = metropolis_parallel(
+        2, 20, 3, 50, 0.8, 0.01, 0.1
+    )
+    np.random.seed(42)
+    position_vecs_2, _, alpha_buffers_2, _, _, _ = metropolis_parallel(
+        2, 20, 3, 50, 0.8, 0.01, 0.1
+    )
+
+    assert np.array_equal(
+        position_vecs_1, position_vecs_2
+    ), "Walker positions differ between runs with the same seed."
+    assert np.array_equal(
+        alpha_buffers_1, alpha_buffers_2
+    ), "Alpha buffers differ between runs with the same seed."
+
+
+def test_workers_capped_at_cpu_count():
+    """
+    Test that metropolis_parallel starts no more threads than there are cores.
+
+    GIVEN: More chains than reported CPU cores, and numba available.
+    WHEN: The metropolis_parallel function is called.
+    THEN: The thread pool should be sized to the number of cores, and every chain
+    should still be run.
+    """
+    pytest.importorskip("numba")
+
+    with patch("vmc_simulation.simulation.os.cpu_count", return_value=2), patch(
+        "vmc_simulation.simulation.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    ) as mock_executor:
+        position_vecs, *_ = metropolis_parallel(5, 10, 3, 20, 0.8, 0.01, 0.1)
+
+    mock_executor.assert_called_once_with(max_workers=2)
+    assert position_vecs.shape == (5, 20), "Every chain should be run."
+
+
+def test_process_path_matches_thread_path():
+    """
+    Test that chains run in worker processes match the chains run on threads.
+
+    GIVEN: The same global seed, and numba reported as unavailable for the second
+    run so that its chains are sent to the process pool.
+    WHEN: The metropolis_parallel function is called for both runs.
+    THEN: Both runs should return identical results, since each chain is seeded.
+    """
+    pytest.importorskip("numba")
+
+    np.random.seed(11)
+    thread_results = metropolis_parallel(2, 10, 3, 20, 0.8, 0.01, 0.1)
+    np.random.seed(11)
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+        process_results = metropolis_parallel(2, 10, 3, 20, 0.8, 0.01, 0.1)
+
+    for thread_result, process_result in zip(thread_results, process_results):
+        assert np.array_equal(
+            thread_result, process_result
+        ), "The process pool should give the same chains as the threads."
@@ -1,7 +1,11 @@
+import warnings
 from unittest.mock import patch
 import numpy as np
 import pytest
+from vmc_simulation.simulation import local_energy_func
 from vmc_simulation.simulation import metropolis
+from vmc_simulation.simulation import _equilibrate
+from vmc_simulation.simulation import _tune_step_size
 
 
 def test_raise_error_on_invalid_p():
@@ -20,16 +24,13 @@ def test_raise_error_on_invalid_p():
     learning_rate = 0.01
     step_size = 0.1
 
-    with patch("numpy.random.uniform") as mock_uniform, patch(
-        "numpy.random.randn"
-    ) as mock_randn:
+    with patch("numpy.random.uniform") as mock_uniform:
 
         def mock_random_uniform(*args, **kwargs):
             if kwargs.get("size") == numwalkers:
                 return np.array([2.5, 3.0, 0.0])
             return np.array([0.5, 0.5, 0.5])
 
-        mock_randn.return_value = np.zeros(numwalkers)
         mock_uniform.side_effect = mock_random_uniform
 
         with pytest.raises(
@@ -45,6 +46,23 @@ def test_raise_error_on_invalid_p():
             )
 
 
+@pytest.mark.parametrize("alpha", [40.0, 60.0, 200.0])
+def test_large_valid_alpha_runs(alpha):
+    """
+    Test that metropolis accepts large alphas inside the documented range.
+
+    GIVEN: An alpha for which exp(-α x) underflows in single precision at x in [2, 3].
+    WHEN: The metropolis function is called.
+    THEN: No division-by-zero error should be raised and the buffers should be filled.
+    """
+    _, _, alpha_buffer, E_buffer, _, _ = metropolis(
+        10, 2, 50, alpha, 1e-4, 0.1, progress=False, seed=1
+    )
+
+    assert len(alpha_buffer) == 2, "Alpha buffer does not have the expected length."
+    assert np.all(np.isfinite(E_buffer)), "The energies should be finite."
+
+
 def invalid_negative_position_not_accepted():
     """
     Test that metropolis does not accept new_position_vec when it contains negative values.
@@ -80,58 +98,40 @@ def invalid_negative_position_not_accepted():
         ), "Metropolis should reject invalid moves."
 
 
-def test_small_positive_position_effect():
+@pytest.mark.parametrize("numba_available", [True, False])
+def test_small_positive_position_effect(numba_available):
     """
-    Test that metropolis accepts small positive position values.
-
-    GIVEN: A new_position_vec containing very small positive values for one walker.
-    WHEN: The metropolis function is called.
-    THEN: The simulation runs without raising warnings or errors on the final position.
+    Test that the sweeps handle walkers at very small positive positions.
 
+    GIVEN: Walkers very close to zero and a step size of the same order.
+    WHEN: The equilibration sweeps are run, with and without numba.
+    THEN: Moves are accepted without warnings, every position stays positive and
+    the local energy stays finite.
     """
-    np.random.seed(42)
-    equilibration_steps = 1
-    numsteps = 1
-    numwalkers = 3
-    alpha = 1.0
-    learning_rate = 0.01
-    step_size = 0.1
+    position_vec = np.array([1e-10, 1e-5, 1e-8], dtype=np.float32)
+    rngs = (np.random.default_rng(42),)
 
-    with patch("numpy.random.randn") as mock_randn:
-        mock_randn.return_value = np.array([1e-10, 1e-5, 1e-8])
-
-        (
-            position_vec_fin,
-            alpha_fin,
-            alpha_buffer,
-            E_buffer,
-            dE_da_buffer,
-            initial_pos,
-        ) = metropolis(
-            equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
-        )
+    with patch(
+        "vmc_simulation.simulation.NUMBA_AVAILABLE", numba_available
+    ), warnings.catch_warnings():
+        warnings.simplefilter("error")
+        n_accepted = _equilibrate(position_vec, 1.0, 100, 1e-5, rngs)
+        local_energy = local_energy_func(position_vec, 1.0)
 
-        assert (
-            position_vec_fin is not None
-        ), "The simulation did not complete successfully."
-        assert (
-            alpha_fin is not None
-        ), "Alpha optimization did not complete successfully."
-        assert (
-            len(alpha_buffer) == numsteps
-        ), "Alpha buffer does not have the expected length."
-        assert (
-            len(E_buffer) == numsteps
-        ), "Energy buffer does not have the expected length."
+    assert n_accepted > 0, "Small positive moves should be accepted."
+    assert np.all(position_vec > 0), "Walkers must never move to x <= 0."
+    assert np.all(
+        np.isfinite(local_energy)
+    ), "The local energy should stay finite for small positive positions."
 
 
-def test_alpha_convergence():
+@pytest.fixture(scope="module")
+def standard_run():
     """
-    Test that alpha converges towards an expected value when given reasonable parameters
+    Run metropolis once with standard parameters and share the result.
 
-    GIVEN: reasonable starting parameters.
-    WHEN: The metropolis function is run for sufficient steps.
-    THEN: Alpha should change and move toward a stable value.
+    The simulation is deterministic for a fixed seed, so the tests that only
+    inspect different fields of the same run do not need to repeat it.
     """
     np.random.seed(42)
 
@@ -142,17 +142,28 @@ def test_alpha_convergence():
     learning_rate = 0.01
     step_size = 0.1
 
-    _, alpha_fin, alpha_buffer, _, _, _ = metropolis(
+    return metropolis(
         equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
     )
 
+
+def test_alpha_convergence(standard_run):
+    """
+    Test that alpha converges towards an expected value when given reasonable parameters
+
+    GIVEN: reasonable starting parameters.
+    WHEN: The metropolis function is run for sufficient steps.
+    THEN: Alpha should change and move toward a stable value.
+    """
+    _, alpha_fin, alpha_buffer, _, _, _ = standard_run
+
     assert (
         abs(alpha_buffer[-1] - alpha_buffer[0]) > 0.01
     ), "Alpha did not change significantly, indicating no optimization."
     assert np.isfinite(alpha_fin), "Final alpha is not finite."
 
 
-def test_final_positions_distribution():
+def test_final_positions_distribution(standard_run):
     """
     Test that the final walker positions are within a reasonable range when given reasonable parameters.
 
@@ -160,18 +171,7 @@ def test_final_positions_distribution():
     WHEN: The metropolis function is run.
     THEN: The final walker positions should be within a physically reasonable range.
     """
-    np.random.seed(42)
-
-    equilibration_steps = 100
-    numsteps = 50
-    numwalkers = 500
-    alpha = 0.8
-    learning_rate = 0.01
-    step_size = 0.1
-
-    position_vec_fin, _, _, _, _, _ = metropolis(
-        equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
-    )
+    position_vec_fin, _, _, _, _, _ = standard_run
 
     assert np.all(position_vec_fin > 0), "Some walker positions are non-physical (≤ 0)."
     assert np.max(position_vec_fin) < 15, "Position values are unreasonably large."
@@ -290,3 +290,373 @@ def test_equilibration_zero_warning():
         match="equilibration_steps is set to 0. The system will not equilibrate before optimization.",
     ):
         metropolis(0, 10, 10, 1.0, 0.01, 0.1)
+
+
+def test_numpy_fallback_without_numba():
+    """
+    Test that metropolis runs on the pure NumPy path when numba is not available.
+
+    GIVEN: Reasonable parameters and numba reported as unavailable.
+    WHEN: The metropolis function is called.
+    THEN: Buffers have the expected length and the walkers stay in the physical region.
+    """
+    np.random.seed(42)
+
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+        position_vec_fin, alpha_fin, alpha_buffer, E_buffer, _, _ = metropolis(
+            50, 10, 200, 0.8, 0.01, 0.1
+        )
+
+    assert len(alpha_buffer) == 10, "Alpha buffer does not have the expected length."
+    assert len(E_buffer) == 10, "Energy buffer does not have the expected length."
+    assert np.isfinite(alpha_fin), "Final alpha is not finite."
+    assert np.all(position_vec_fin > 0), "Some walker positions are non-physical (≤ 0)."
+
+
+def test_parallel_sweep_path():
+    """
+    Test that the multi-threaded numba sweep produces physical walker positions.
+
+    GIVEN: The parallel sweep enabled for any number of walkers.
+    WHEN: The metropolis function is called with reasonable parameters.
+    THEN: Buffers have the expected length and the walkers stay in the physical region.
+    """
+    pytest.importorskip("numba")
+    np.random.seed(42)
+
+    with patch("vmc_simulation.simulation._PARALLEL_MIN_WALKERS", 1):
+        position_vec_fin, alpha_fin, alpha_buffer, _, _, _ = metropolis(
+            50, 10, 200, 0.8, 0.01, 0.1
+        )
+
+    assert len(alpha_buffer) == 10, "Alpha buffer does not have the expected length."
+    assert np.isfinite(alpha_fin), "Final alpha is not finite."
+    assert np.all(position_vec_fin > 0), "Some walker positions are non-physical (≤ 0)."
+
+
+def test_parallel_sweep_reproducible():
+    """
+    Test that the multi-threaded numba sweep is reproducible through np.random.seed.
+
+    GIVEN: The parallel sweep enabled for any number of walkers and a fixed seed.
+    WHEN: The metropolis function is called twice with the same parameters.
+    THEN: Both runs return identical walker positions and alpha buffers.
+    """
+    pytest.importorskip("numba")
+
+    with patch("vmc_simulation.simulation._PARALLEL_MIN_WALKERS", 1):
+        np.random.seed(42)
+        position_vec_1, _, alpha_buffer_1, _, _, _ = metropolis(
+            50, 10, 200, 0.8, 0.01, 0.1
+        )
+        np.random.seed(42)
+        position_vec_2, _, alpha_buffer_2, _, _, _ = metropolis(
+            50, 10, 200, 0.8, 0.01, 0.1
+        )
+
+    assert np.array_equal(
+        position_vec_1, position_vec_2
+    ), "Walker positions differ between runs with the same seed."
+    assert np.array_equal(
+        alpha_buffer_1, alpha_buffer_2
+    ), "Alpha buffers differ between runs with the same seed."
+
+
+def test_explicit_seed_reproducible():
+    """
+    Test that an explicit seed makes metropolis reproducible on its own.
+
+    GIVEN: The same seed passed to two runs, with different global NumPy states.
+    WHEN: The metropolis function is called with reasonable parameters.
+    THEN: Both runs return identical initial positions, final positions and alpha buffers.
+    """
+    np.random.seed(1)
+    position_vec_1, _, alpha_buffer_1, _, _, initial_pos_1 = metropolis(
+        50, 10, 200, 0.8, 0.01, 0.1, seed=123
+    )
+    np.random.seed(2)
+    position_vec_2, _, alpha_buffer_2, _, _, initial_pos_2 = metropolis(
+        50, 10, 200, 0.8, 0.01, 0.1, seed=123
+    )
+
+    assert np.array_equal(
+        initial_pos_1, initial_pos_2
+    ), "Initial positions differ between runs with the same seed."
+    assert np.array_equal(
+        position_vec_1, position_vec_2
+    ), "Walker positions differ between runs with the same seed."
+    assert np.array_equal(
+        alpha_buffer_1, alpha_buffer_2
+    ), "Alpha buffers differ between runs with the same seed."
+
+
+def test_energy_buffer_matches_final_state():
+    """
+    Test that the last energy entry is the mean local energy of the final state.
+
+    GIVEN: Reasonable parameters.
+    WHEN: The metropolis function is run.
+    THEN: E_buffer[-1] should equal the mean local energy of the final walkers at the final alpha.
+    """
+    np.random.seed(42)
+
+    position_vec_fin, alpha_fin, _, E_buffer, _, _ = metropolis(
+        50, 10, 200, 0.8, 0.01, 0.1
+    )
+
+    expected_energy = np.mean(local_energy_func(position_vec_fin, alpha_fin))
+    assert np.isclose(
+        E_buffer[-1], expected_energy, atol=1e-6
+    ), f"Expected {expected_energy}, got {E_buffer[-1]}"
+
+
+def test_progress_bar_disabled(capsys):
+    """
+    Test that metropolis prints no progress bar when progress is disabled.
+
+    GIVEN: progress=False and otherwise reasonable parameters.
+    WHEN: The metropolis function is called.
+    THEN: Nothing should be written to stderr.
+    """
+    np.random.seed(42)
+
+    metropolis(10, 5, 50, 1.0, 0.01, 0.1, progress=False)
+
+    assert capsys.readouterr().err == "", "A progress bar was printed."
+
+
+def test_initial_positions_not_aliased():
+    """
+    Test that the returned initial positions are not modified by the in-place sweeps.
+
+    GIVEN: Reasonable parameters.
+    WHEN: The metropolis function is run.
+    THEN: initial_pos should still hold the uniform [2, 3) start and differ from the final positions.
+    """
+    np.random.seed(42)
+
+    position_vec_fin, _, _, _, _, initial_pos = metropolis(
+        50, 10, 200, 0.8, 0.01, 0.1
+    )
+
+    assert initial_pos is not position_vec_fin, "initial_pos aliases the final positions."
+    assert np.all((initial_pos >= 2) & (initial_pos < 3)), "initial_pos was modified."
+    assert not np.array_equal(
+        initial_pos, position_vec_fin
+    ), "The walkers did not move from their initial positions."
+
+
+def test_alpha_frozen_after_small_gradients():
+    """
+    Test that metropolis stops updating alpha once the gradient has stayed small.
+
+    GIVEN: A freezing tolerance that every gradient satisfies, on the NumPy path.
+    WHEN: The metropolis function is run for more steps than the freezing window.
+    THEN: After the window, dE/dα should be recorded as 0 and alpha should stay constant.
+    """
+    np.random.seed(42)
+
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False), patch(
+        "vmc_simulation.simulation._FREEZE_TOL", 1e3
+    ), patch("vmc_simulation.simulation._FREEZE_STEPS", 3):
+        _, alpha_fin, alpha_buffer, E_buffer, dE_da_buffer, _ = metropolis(
+            20, 8, 100, 0.8, 0.01, 0.1
+        )
+
+    assert np.all(dE_da_buffer[:3] != 0), "Alpha was frozen before the window elapsed."
+    assert np.all(dE_da_buffer[3:] == 0), "Frozen steps should record a zero gradient."
+    assert np.all(alpha_buffer[3:] == alpha_buffer[2]), "Alpha changed after freezing."
+    assert np.all(np.isfinite(E_buffer)), "Energy buffer contains non-finite values."
+
+
+@pytest.mark.parametrize("invalid_value", [0, 1, -0.5, 1.5])
+def test_invalid_target_acceptance_values(invalid_value):
+    """
+    Test that metropolis raises a ValueError for a target acceptance outside (0, 1).
+
+    GIVEN: A target_acceptance that is not strictly between 0 and 1.
+    WHEN: The metropolis function is called.
+    THEN: A ValueError should be raised with the correct error message.
+    """
+    with pytest.raises(ValueError, match="target_acceptance must be between 0 and 1."):
+        metropolis(10, 5, 50, 1.0, 0.01, 0.1, target_acceptance=invalid_value)
+
+
+@pytest.mark.parametrize("invalid_value", ["0.3", [0.3], 0.3 + 0j])
+def test_invalid_target_acceptance_types(invalid_value):
+    """
+    Test that metropolis raises a TypeError for a non-numeric target acceptance.
+
+    GIVEN: A target_acceptance of an invalid type.
+    WHEN: The metropolis function is called.
+    THEN: A TypeError should be raised with the correct error message.
+    """
+    with pytest.raises(TypeError, match="target_acceptance must be a float or None."):
+        metropolis(10, 5, 50, 1.0, 0.01, 0.1, target_acceptance=invalid_value)
+
+
+def test_step_size_tuning_reaches_target():
+    """
+    Test that the step-size tuning drives the acceptance rate towards the target.
+
+    GIVEN: Walkers started with a step size far too small for the target acceptance.
+    WHEN: The step size is tuned at fixed alpha.
+    THEN: Sweeps with the tuned step size should accept moves close to the target rate.
+    """
+    rngs = (np.random.default_rng(42),)
+    position_vec = rngs[0].uniform(2, 3, 1000).astype(np.float32)
+    alpha = 0.8
+    target_acceptance = 0.44
+
+    step_size = _tune_step_size(position_vec, alpha, 2000, 0.1, target_acceptance, rngs)
+    acceptance = _equilibrate(position_vec, alpha, 200, step_size, rngs) / (200 * 1000)
+
+    assert step_size > 0.1, "The step size should have grown from its initial value."
+    assert (
+        abs(acceptance - target_acceptance) < 0.05
+    ), f"Expected an acceptance rate close to {target_acceptance}, got {acceptance}"
+
+
+def test_metropolis_with_step_size_tuning():
+    """
+    Test that metropolis runs with step-size tuning enabled.
+
+    GIVEN: Reasonable parameters and a target acceptance rate.
+    WHEN: The metropolis function is called.
+    THEN: Buffers have the expected length and the walkers stay in the physical region.
+    """
+    np.random.seed(42)
+
+    position_vec_fin, alpha_fin, alpha_buffer, _, _, _ = metropolis(
+        100, 10, 200, 0.8, 0.01, 0.1, target_acceptance=0.44
+    )
+
+    assert len(alpha_buffer) == 10, "Alpha buffer does not have the expected length."
+    assert np.isfinite(alpha_fin), "Final alpha is not finite."
+    assert np.all(position_vec_fin > 0), "Some walker positions are non-physical (≤ 0)."
+
+
+def test_invalid_optimizer():
+    """
+    Test that metropolis raises a ValueError for an unknown optimizer.
+
+    GIVEN: An optimizer name other than "sgd" or "adam".
+    WHEN: The metropolis function is called.
+    THEN: A ValueError should be raised with the correct error message.
+    """
+    with pytest.raises(ValueError, match="optimizer must be 'sgd' or 'adam'."):
+        metropolis(10, 5, 50, 1.0, 0.01, 0.1, optimizer="rmsprop")
+
+
+@pytest.mark.parametrize("numba_available", [True, False])
+def test_adam_alpha_convergence(numba_available):
+    """
+    Test that alpha converges towards 1 with the Adam optimizer.
+
+    GIVEN: Reasonable parameters, optimizer="adam", with and without numba.
+    WHEN: The metropolis function is run for sufficient steps.
+    THEN: The final alpha should be close to the exact value 1.
+    """
+    if numba_available:
+        pytest.importorskip("numba")
+    np.random.seed(42)
+
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", numba_available):
+        _, alpha_fin, alpha_buffer, _, _, _ = metropolis(
+            100, 60, 1000, 0.8, 0.01, 0.1, optimizer="adam"
+        )
+
+    assert (
+        abs(alpha_buffer[0] - 0.8) < 0.02
+    ), "The first Adam step moved alpha by much more than the learning rate."
+    assert abs(alpha_fin - 1.0) < 0.05, f"Expected alpha close to 1, got {alpha_fin}"
+
+
+def test_stationary_init_distribution():
+    """
+    Test that init="stationary" draws the walkers from Ψ(x) ∝ exp(-α x).
+
+    GIVEN: init="stationary", a positive alpha and no sampling sweeps.
+    WHEN: The metropolis function is called.
+    THEN: The initial positions should be positive with mean and standard deviation 1/α.
+    """
+    alpha = 0.8
+    *_, initial_pos = metropolis(
+        0, 1, 100_000, alpha, 0.0, 0.1, seed=5, init="stationary"
+    )
+
+    assert np.all(initial_pos > 0), "Stationary initial positions must be positive."
+    assert np.isclose(
+        initial_pos.mean(), 1 / alpha, rtol=0.02
+    ), "The mean of the initial positions should be 1/alpha."
+    assert np.isclose(
+        initial_pos.std(), 1 / alpha, rtol=0.02
+    ), "The spread of the initial positions should be 1/alpha."
+
+
+def test_invalid_init():
+    """
+    Test that metropolis rejects an unknown init or a stationary init with alpha <= 0.
+
+    GIVEN: An init name other than "uniform" or "stationary", or init="stationary"
+    with a non-positive alpha.
+    WHEN: The metropolis function is called.
+    THEN: A ValueError should be raised with the correct error message.
+    """
+    with pytest.raises(ValueError, match="init must be 'uniform' or 'stationary'."):
+        metropolis(10, 5, 50, 1.0, 0.01, 0.1, init="gamma")
+    with pytest.raises(ValueError, match="init='stationary' requires a positive alpha."):
+        metropolis(10, 5, 50, 0.0, 0.01, 0.1, init="stationary")
+
+
+def test_refresh_steps_matches_full_equilibration():
+    """
+    Test that refresh_steps equal to equilibration_steps reproduces the default run.
+
+    GIVEN: A seeded run with refresh_steps = equilibration_steps and one without it.
+    WHEN: The metropolis function is called for both.
+    THEN: Both runs should give identical positions and buffers.
+    """
+    default_run = metropolis(50, 20, 200, 0.8, 0.01, 0.1, seed=7)
+    refreshed_run = metropolis(50, 20, 200, 0.8, 0.01, 0.1, seed=7, refresh_steps=50)
+
+    for default_result, refreshed_result in zip(default_run, refreshed_run):
+        assert np.array_equal(
+            default_result, refreshed_result
+        ), "refresh_steps = equilibration_steps should not change the run."
+
+
+def test_refresh_steps_alpha_convergence():
+    """
+    Test that alpha still converges towards 1 with fewer sweeps between steps.
+
+    GIVEN: A full first equilibration followed by a short refresh at every later step.
+    WHEN: The metropolis function is run for sufficient steps.
+    THEN: The final alpha should be close to the exact value 1.
+    """
+    _, alpha_fin, *_ = metropolis(
+        1000, 120, 5000, 0.8, 0.01, 0.1, progress=False, seed=3, refresh_steps=200
+    )
+
+    assert np.isclose(
+        alpha_fin, 1.0, atol=0.05
+    ), "Alpha should converge towards 1 with refresh_steps."
+
+
+@pytest.mark.parametrize(
+    "refresh_steps, error, message",
+    [
+        (1.5, TypeError, "refresh_steps must be an integer or None."),
+        (-1, ValueError, "refresh_steps must be a non-negative integer."),
+    ],
+)
+def test_invalid_refresh_steps(refresh_steps, error, message):
+    """
+    Test that metropolis rejects a non-integer or negative refresh_steps.
+
+    GIVEN: refresh_steps that is a float or a negative integer.
+    WHEN: The metropolis function is called.
+    THEN: The corresponding error should be raised with the correct message.
+    """
+    with pytest.raises(error, match=message):
+        metropolis(10, 5, 50, 1.0, 0.01, 0.1, refresh_steps=refresh_steps)
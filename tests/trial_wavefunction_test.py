@@ -1,3 +1,4 @@
+from unittest.mock import patch
 import numpy as np
 import pytest
 from vmc_simulation.simulation import trial_wavefunction
@@ -210,3 +211,44 @@ def test_invalid_alpha_types(invalid_alpha):
 
     with pytest.raises(TypeError, match="Alpha must be a real number."):
         trial_wavefunction(x_values, invalid_alpha)
+
+
+def test_numpy_fallback_matches():
+    """
+    Test that the compiled and the pure NumPy trial_wavefunction agree.
+
+    GIVEN: Positions on both sides of zero and a valid alpha.
+    WHEN: trial_wavefunction is called with and without numba.
+    THEN: Both results should be the same up to rounding.
+    """
+    x_values = np.linspace(-1.0, 5.0, 61)
+    alpha = 0.8
+
+    result = trial_wavefunction(x_values, alpha)
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+        expected_output = trial_wavefunction(x_values, alpha)
+
+    assert np.allclose(
+        result, expected_output, atol=1e-10
+    ), "The compiled and NumPy wavefunctions differ."
+
+
+def test_nan_position_matches_fallback():
+    """
+    Test that the compiled and the pure NumPy trial_wavefunction agree on NaN.
+
+    GIVEN: A position array containing NaN.
+    WHEN: trial_wavefunction is called with and without numba.
+    THEN: Both should return 0 for the NaN entry, since NaN > 0 is false.
+    """
+    x_values = np.array([np.nan, 1.0], dtype=np.float32)
+    alpha = 0.5
+
+    result = trial_wavefunction(x_values, alpha)
+    with patch("vmc_simulation.simulation.NUMBA_AVAILABLE", False):
+        expected_output = trial_wavefunction(x_values, alpha)
+
+    assert result[0] == 0, "The compiled wavefunction should be 0 for NaN."
+    assert np.array_equal(
+        result, expected_output
+    ), "The compiled and NumPy wavefunctions differ for NaN positions."
@@ -1,6 +1,36 @@
 import configparser
+import functools
 import os
 
+# Parameters read from the [Simulation] section, with the type each is converted to.
+_SIMULATION_PARAMS = (
+    ("numwalkers", int),
+    ("numsteps", int),
+    ("equilibration_steps", int),
+    ("alpha", float),
+    ("learning_rate", float),
+    ("step_size", float),
+    ("output_dir", str),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_cached(config_path, mtime):
+    """
+    Parse the [Simulation] section of `config_path`.
+
+    `mtime` is only part of the cache key, so that an edited file is read again.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    if "Simulation" not in config:
+        return {}
+
+    section = config["Simulation"]
+    return {
+        name: cast(section[name]) for name, cast in _SIMULATION_PARAMS if name in section
+    }
+
 
 def parse_config_file(config_path):
     """
@@ -21,29 +51,12 @@ def parse_config_file(config_path):
     FileNotFoundError
         If the specified config file does not exist.
 
+    Notes
+    -----
+    Parsed files are cached by path and modification time, so repeated calls on an
+    unchanged file do not read it again. Every call returns a new dictionary.
     """
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file '{config_path}' not found.")
 
-    config = configparser.ConfigParser()
-    config.read(config_path)
-    config_params = {}
-
-    if "Simulation" in config:
-        section = config["Simulation"]
-        if "numwalkers" in section:
-            config_params["numwalkers"] = int(section["numwalkers"])
-        if "numsteps" in section:
-            config_params["numsteps"] = int(section["numsteps"])
-        if "equilibration_steps" in section:
-            config_params["equilibration_steps"] = int(section["equilibration_steps"])
-        if "alpha" in section:
-            config_params["alpha"] = float(section["alpha"])
-        if "learning_rate" in section:
-            config_params["learning_rate"] = float(section["learning_rate"])
-        if "step_size" in section:
-            config_params["step_size"] = float(section["step_size"])
-        if "output_dir" in section:
-            config_params["output_dir"] = section["output_dir"]
-
-    return config_params
+    return dict(_parse_cached(config_path, os.path.getmtime(config_path)))
@@ -1,5 +1,4 @@
 import argparse
-import sys
 from vmc_simulation.simulation import metropolis
 from vmc_simulation.config_handler import parse_config_file
 from vmc_simulation.plot import (
@@ -67,20 +66,18 @@ def main():
         help="Directory to save outputs (default: ./results)",
     )
 
-    args = parser.parse_args()
-    config_args = {}
-    if args.config:
-        config_args = parse_config_file(args.config)
+    # Precedence is command line > config file > defaults. Options given on the
+    # command line are the only ones left once every default is suppressed.
+    defaults = vars(parser.parse_args([]))
+    for action in parser._actions:
+        action.default = argparse.SUPPRESS
+    cli_args = vars(parser.parse_args())
 
-    for key, value in vars(args).items():
-        if f"--{key}" in sys.argv and value is not None:
-            config_args[key] = value
+    config_args = {}
+    if cli_args.get("config"):
+        config_args = parse_config_file(cli_args["config"])
 
-    for key, value in config_args.items():
-        if value is None and key in parser._option_string_actions:
-            setattr(args, key, parser.get_default(key))
-        else:
-            setattr(args, key, value)
+    args = argparse.Namespace(**{**defaults, **config_args, **cli_args})
 
     position_vec_fin, alpha_fin, alpha_buffer, E_buffer, dE_da_buffer, initial_pos = (
         metropolis(
@@ -1,7 +1,90 @@
+import math
 import numpy as np
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
 from tqdm import tqdm
 
+try:
+    import numba
+except ImportError:  # numba is optional, the NumPy path below is used instead
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+# fastmath flags for kernels exposed to arbitrary input: all of them except the
+# no-NaN and no-Inf assumptions, so that 0 and NaN propagate as they do in NumPy.
+_FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# Below this many walkers the thread start-up cost outweighs the parallel sweep.
+_PARALLEL_MIN_WALKERS = 100_000
+
+# Independent random streams used by the parallel sweep, one per slice of walkers.
+# Fixed, so that results do not depend on the number of threads.
+_PARALLEL_STREAMS = 64
+
+# Random numbers drawn per generator call by the NumPy sweep (4 MB of float32).
+_RNG_BLOCK = 1 << 20
+
+# Walkers swept together by the compiled kernel: 65536 float32 positions (256 KB)
+# stay in L2.
+_SWEEP_BLOCK = 65_536
+
+# Alpha is frozen once |dE/dα| stays below _FREEZE_TOL for _FREEZE_STEPS steps.
+_FREEZE_TOL = 1e-6
+_FREEZE_STEPS = 10
+
+# Adam's decay rates for the gradient moments and its denominator guard.
+_ADAM_BETA1 = 0.9
+_ADAM_BETA2 = 0.999
+_ADAM_EPS = 1e-8
+
+# Sweeps between two step-size updates when tuning towards a target acceptance.
+_TUNE_INTERVAL = 50
+
+# Dual-averaging constants (Hoffman & Gelman, 2014): shrinkage towards
+# log(10 * step_size), damping of early updates and decay of the averaging weights.
+_DA_GAMMA = 0.05
+_DA_T0 = 10
+_DA_KAPPA = 0.75
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.vectorize(
+        ["float32(float32, float32)", "float64(float64, float64)"],
+        fastmath=_FASTMATH_FLAGS,
+        cache=True,
+    )
+    def _trial_wavefunction_ufunc(x, alpha):
+        """Elementwise exp(-α x) for x > 0 and 0 otherwise, compiled as a SIMD ufunc."""
+        if x > 0:
+            return math.exp(-alpha * x)
+        return 0.0
+
+
+def _validate_alpha(alpha):
+    """
+    Check the variational parameter alpha.
+
+    Raises
+    ------
+    TypeError
+        If `alpha` is not a real number (integer or float).
+    ValueError
+        If `alpha` is less than -1000 or greater than 200, as such values
+        lead to numerical instability.
+    """
+    if not isinstance(alpha, (int, float)):
+        raise TypeError("Alpha must be a real number.")
+
+    if alpha < -1000:
+        raise ValueError("Too large negative alpha causes numerical instability.")
+
+    if alpha > 200:
+        raise ValueError("Too large alpha causes numerical instability.")
+
 
 def trial_wavefunction(x, alpha):
     """
@@ -32,20 +115,31 @@ def trial_wavefunction(x, alpha):
     ValueError
         If `alpha` is less than -1000 or greater than 200, as such values
         lead to numerical instability.
-    """
-    if not isinstance(alpha, (int, float)):
-        raise TypeError("Alpha must be a real number.")
 
-    if alpha < -1000:
-        raise ValueError("Too large negative alpha causes numerical instability.")
+    Notes
+    -----
+    - When numba is installed the masked exponential is evaluated by a compiled
+      ufunc in a single vectorized pass, without the temporaries of `np.where`.
+    """
+    _validate_alpha(alpha)
 
-    if alpha > 200:
-        raise ValueError("Too large alpha causes numerical instability.")
+    if NUMBA_AVAILABLE:
+        return _trial_wavefunction_ufunc(x, alpha)
 
     result = np.where(x > 0, np.exp(-alpha * x), 0)
     return result
 
 
+if NUMBA_AVAILABLE:
+
+    @numba.vectorize(
+        ["float64(float64, float64)"], fastmath=_FASTMATH_FLAGS, cache=True
+    )
+    def _local_energy_ufunc(x, alpha):
+        """Elementwise (α - 1)/x - α²/2, compiled as a SIMD ufunc."""
+        return (alpha - 1.0) / x - 0.5 * alpha * alpha
+
+
 def local_energy_func(x, alpha):
     """
     Compute the local energy for a given set of positions and a variational parameter alpha.
@@ -56,17 +150,77 @@ def local_energy_func(x, alpha):
     Parameters
     ----------
     x : numpy.ndarray
-        Array of position values (one for each walker). Must be non-negative.
+        Array of position values (one for each walker). Must be non-zero; positions
+        produced by `metropolis` are always strictly positive.
     alpha : float
         Variational parameter affecting the energy calculation. Must be a real number.
 
     Returns
     -------
     numpy.ndarray
-        Array of local energy values corresponding to the input positions.
+        Array of local energy values corresponding to the input positions. Entries
+        for x = 0 are infinite; the input is not scanned for zeros, since this
+        function sits on the hot path.
+
+    Notes
+    -----
+    - The expression -1/x - α²/2 + α/x is evaluated in the factored form
+      (α - 1)/x - α²/2, which needs a single reciprocal of `x`.
+    - When numba is installed, arrays of any shape are evaluated by a compiled
+      ufunc in one pass with no temporaries. The result is always double precision.
+    """
+    if NUMBA_AVAILABLE and isinstance(x, np.ndarray):
+        return _local_energy_ufunc(x, alpha)
 
+    inv_x = 1.0 / x
+    return inv_x * (alpha - 1.0) - 0.5 * alpha * alpha
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(fastmath=_FASTMATH_FLAGS, error_model="numpy", cache=True)
+    def _energy_moments_njit(x, alpha):
+        """
+        Compute dE/dα = -2 Cov(E_L, x) and ⟨1/x⟩ in a single pass over `x`.
+
+        The local energy is evaluated inline and the co-moment is accumulated
+        with Welford's update, which avoids the cancellation of the naive
+        ⟨E_L x⟩ - ⟨E_L⟩⟨x⟩ form for large positions. ⟨1/x⟩ gives the mean local
+        energy at any alpha as (α - 1)⟨1/x⟩ - α²/2.
+        """
+        half_alpha_sq = 0.5 * alpha * alpha
+        alpha_minus_one = alpha - 1.0
+        mean_x = 0.0
+        mean_El = 0.0
+        comoment = 0.0
+        sum_inv_x = 0.0
+        for k in range(x.shape[0]):
+            xk = x[k]
+            inv_xk = 1.0 / xk
+            El = alpha_minus_one * inv_xk - half_alpha_sq
+            dx = xk - mean_x
+            mean_x += dx / (k + 1)
+            mean_El += (El - mean_El) / (k + 1)
+            comoment += dx * (El - mean_El)
+            sum_inv_x += inv_xk
+        return -2.0 * comoment / x.shape[0], sum_inv_x / x.shape[0]
+
+
+def _energy_moments(x, alpha):
     """
-    return -1 / x - (alpha**2) / 2 + alpha / x
+    Return dE/dα and ⟨1/x⟩ for the walker positions `x`.
+
+    Uses the fused numba pass when available and NumPy reductions otherwise.
+    """
+    if NUMBA_AVAILABLE:
+        return _energy_moments_njit(np.ravel(x), alpha)
+
+    # The reductions are carried out in double precision whatever the walker dtype.
+    x = np.asarray(x, dtype=np.float64)
+    inv_x = 1.0 / x
+    El = inv_x * (alpha - 1.0) - 0.5 * alpha * alpha
+    dE_da = -2 * (np.mean(El * x) - np.mean(El) * np.mean(x))
+    return float(dE_da), float(np.mean(inv_x))
 
 
 def dE_dalpha(x, alpha):
@@ -82,14 +236,15 @@ def dE_dalpha(x, alpha):
     Parameters
     ----------
     x : numpy.ndarray
-        Array of walker positions after equilibration.
+        Array of walker positions after equilibration. Must be non-empty and
+        strictly positive; this is not checked, and invalid input gives nan.
     alpha : float
         Variational parameter influencing the wavefunction.
 
     Returns
     -------
     float
-        The derivative of the energy with respect to alpha.
+        The derivative of the energy with respect to alpha, as a Python float.
 
     Notes
     -----
@@ -99,10 +254,23 @@ def dE_dalpha(x, alpha):
       with respect to α:
       d(log Ψ)/dα = -x
     - Using this formulation helps reduce noise and improves numerical stability in the optimization process.
+    - When numba is installed the local energy and the three means are fused into a
+      single compiled pass over `x`, with no temporary arrays. Multi-dimensional
+      position arrays are reduced over all their elements, as `np.mean` does.
+    - For α = 1 the local energy is the constant -1/2, so its covariance with x
+      vanishes and 0.0 is returned without reading `x`. Invalid positions are
+      therefore not detected at this alpha: where any other alpha gives nan for
+      an `x` containing 0 or NaN, or for an empty `x`, α = 1 still gives 0.0.
     """
+    if alpha == 1.0:
+        return 0.0
+
+    if NUMBA_AVAILABLE:
+        return _energy_moments_njit(np.ravel(x), alpha)[0]
+
+    # With ln_wf = -x the two negations cancel, so no ln_wf array is needed.
     El = local_energy_func(x, alpha)
-    ln_wf = -x
-    return 2 * (np.mean(El * ln_wf) - np.mean(El) * np.mean(ln_wf))
+    return float(-2 * (np.mean(El * x) - np.mean(El) * np.mean(x)))
 
 
 def alpha_opt_on_fly(position_vec, alpha, learning_rate):
@@ -149,7 +317,29 @@ def alpha_opt_on_fly(position_vec, alpha, learning_rate):
     - This method ensures that alpha dynamically adjusts during the Metropolis simulation,
       improving efficiency in finding the optimal wavefunction parameters.
     """
+    _validate_learning_rate(learning_rate)
 
+    dE_da = dE_dalpha(position_vec, alpha)
+    alpha = alpha - learning_rate * dE_da
+    return alpha, dE_da
+
+
+def _validate_learning_rate(learning_rate):
+    """
+    Check the learning rate used by the alpha update.
+
+    Raises
+    ------
+    TypeError
+        If `learning_rate` is not a float or int.
+    ValueError
+        If `learning_rate` is negative.
+
+    Warnings
+    --------
+    UserWarning
+        If `learning_rate` is zero, meaning alpha remains unchanged.
+    """
     if not isinstance(learning_rate, (int, float)):
         raise TypeError("learning_rate must be a float or an integer.")
 
@@ -164,13 +354,340 @@ def alpha_opt_on_fly(position_vec, alpha, learning_rate):
             UserWarning,
         )
 
-    dE_da = dE_dalpha(position_vec, alpha)
-    alpha = alpha - learning_rate * dE_da
-    return alpha, dE_da
+
+def _validate_sampling_args(
+    equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
+):
+    """
+    Check the sampling parameters shared by the `metropolis` entry points.
+
+    Raises the TypeError and ValueError documented in `metropolis` and warns
+    when `equilibration_steps` is zero.
+    """
+    if (
+        not isinstance(equilibration_steps, int)
+        or not isinstance(numsteps, int)
+        or not isinstance(numwalkers, int)
+    ):
+        raise TypeError(
+            "equilibration_steps, numsteps, and numwalkers must be integers."
+        )
+
+    if not isinstance(step_size, (int, float)):
+        raise TypeError("step size must be a float or an integer.")
+
+    if numsteps <= 0 or numwalkers <= 0 or step_size <= 0:
+        raise ValueError(
+            "numsteps, numwalkers and step size must be positive integers greater than 0 to allow walker movement."
+        )
+
+    if equilibration_steps < 0:
+        raise ValueError("equilibration_steps must be a non-negative integer.")
+
+    if equilibration_steps == 0:
+        warnings.warn(
+            "equilibration_steps is set to 0. The system will not equilibrate before optimization.",
+            UserWarning,
+        )
+
+    _validate_alpha(alpha)
+    _validate_learning_rate(learning_rate)
+
+
+def _equilibrate_numpy(position_vec, alpha, equilibration_steps, step_size, rng):
+    """
+    Run `equilibration_steps` Metropolis sweeps over all walkers in place with NumPy.
+
+    Vectorized fallback used when numba is not installed. The random numbers for
+    several sweeps are drawn with one generator call into 2-D scratch buffers of
+    about `_RNG_BLOCK` values, and accepted moves are copied into `position_vec`
+    with `np.copyto`, so no walker-sized array is allocated per sweep. Returns the
+    number of accepted moves.
+    """
+    numwalkers = len(position_vec)
+    alpha = np.float32(alpha)
+    step_size = np.float32(step_size)
+    rows = max(1, min(equilibration_steps, _RNG_BLOCK // numwalkers))
+    shift_block = np.empty((rows, numwalkers), dtype=np.float32)
+    unif_block = np.empty((rows, numwalkers), dtype=np.float32)
+    p = np.empty(numwalkers, dtype=np.float32)
+    new_position_vec = np.empty(numwalkers, dtype=np.float32)
+    accepted = np.empty(numwalkers, dtype=bool)
+    n_accepted = 0
+    for block_start in range(0, equilibration_steps, rows):
+        n_rows = min(rows, equilibration_steps - block_start)
+        rng.standard_normal(dtype=np.float32, out=shift_block[:n_rows])
+        rng.random(dtype=np.float32, out=unif_block[:n_rows])
+        np.multiply(shift_block[:n_rows], step_size, out=shift_block[:n_rows])
+        for i in range(n_rows):
+            shift = shift_block[i]
+            np.add(position_vec, shift, out=new_position_vec)
+            # Ψ(new) / Ψ(old) = exp(-α (new - old)), and new - old is the shift
+            # already drawn, so Ψ(old) never has to be evaluated. Moves to
+            # new <= 0 get p = 0.
+            np.multiply(shift, -alpha, out=p)
+            np.exp(p, out=p)
+            np.copyto(p, 0.0, where=new_position_vec <= 0)
+            np.greater(p, unif_block[i], out=accepted)
+            np.copyto(position_vec, new_position_vec, where=accepted)
+            n_accepted += int(np.count_nonzero(accepted))
+    return n_accepted
+
+
+def _alpha_frozen(dE_da_buffer, j):
+    """
+    Return True when the gradients of the `_FREEZE_STEPS` steps before step `j`
+    are all below `_FREEZE_TOL` in magnitude.
+
+    Frozen steps record a zero gradient, so once frozen alpha stays frozen.
+    """
+    if j < _FREEZE_STEPS:
+        return False
+    for i in range(j - _FREEZE_STEPS, j):
+        if abs(dE_da_buffer[i]) >= _FREEZE_TOL:
+            return False
+    return True
+
+
+def _update_alpha(alpha, dE_da, learning_rate, adam_state):
+    """
+    Take one optimizer step on alpha and return the new value.
+
+    An empty `adam_state` selects plain gradient descent, as in `alpha_opt_on_fly`.
+    Otherwise it holds Adam's first moment, second moment and step count, and is
+    updated in place.
+    """
+    if adam_state.shape[0] == 0:
+        return alpha - learning_rate * dE_da
+    adam_state[2] += 1.0
+    adam_state[0] = _ADAM_BETA1 * adam_state[0] + (1.0 - _ADAM_BETA1) * dE_da
+    adam_state[1] = _ADAM_BETA2 * adam_state[1] + (1.0 - _ADAM_BETA2) * dE_da**2
+    m_hat = adam_state[0] / (1.0 - _ADAM_BETA1 ** adam_state[2])
+    v_hat = adam_state[1] / (1.0 - _ADAM_BETA2 ** adam_state[2])
+    return alpha - learning_rate * m_hat / (math.sqrt(v_hat) + _ADAM_EPS)
+
+
+def _sample_steps_numpy(
+    position_vec,
+    alpha,
+    learning_rate,
+    adam_state,
+    equilibration_steps,
+    step_size,
+    rngs,
+    alpha_buffer,
+    dE_da_buffer,
+    E_buffer,
+    start,
+    stop,
+):
+    """
+    Run sampling steps `start` to `stop` of `metropolis` with NumPy and return alpha.
+
+    Each step equilibrates the walkers, updates alpha with `_update_alpha` and
+    fills the buffers at that step. Only the first of the
+    generators in `rngs` is used.
+    """
+    for j in range(start, stop):
+        _equilibrate_numpy(
+            position_vec, alpha, equilibration_steps, step_size, rngs[0]
+        )
+        if _alpha_frozen(dE_da_buffer, j):
+            # Converged: skip the gradient and only reduce ⟨1/x⟩ for the energy.
+            dE_da = 0.0
+            mean_inv_x = float(np.mean(1.0 / np.asarray(position_vec, np.float64)))
+        else:
+            # One pass over the walkers gives both the gradient and ⟨1/x⟩, from
+            # which the mean energy at the new alpha follows.
+            dE_da, mean_inv_x = _energy_moments(position_vec, alpha)
+            alpha = _update_alpha(alpha, dE_da, learning_rate, adam_state)
+        alpha_buffer[j] = alpha
+        dE_da_buffer[j] = dE_da
+        E_buffer[j] = (alpha - 1.0) * mean_inv_x - 0.5 * alpha * alpha
+    return alpha
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(fastmath=True, cache=True, nogil=True)
+    def _equilibrate_njit(position_vec, alpha, equilibration_steps, step_size, rng):
+        """
+        Run `equilibration_steps` Metropolis sweeps over all walkers in place.
+
+        Compiled counterpart of `_equilibrate_numpy`: walkers are visited one at a
+        time, so no temporary arrays are allocated. The acceptance ratio
+        Ψ(new) / Ψ(old) is evaluated as exp(-α (new - old)), one exponential per
+        walker, and moves to non-positive positions (where Ψ = 0) are rejected.
+
+        Walkers are independent, so the sweeps are run block by block: each block
+        of `_SWEEP_BLOCK` walkers goes through all `equilibration_steps` while it
+        is still resident in cache. Returns the number of accepted moves.
+        """
+        numwalkers = position_vec.shape[0]
+        n_accepted = 0
+        for block_start in range(0, numwalkers, _SWEEP_BLOCK):
+            block_end = min(block_start + _SWEEP_BLOCK, numwalkers)
+            for i in range(equilibration_steps):
+                for k in range(block_start, block_end):
+                    new_position = np.float32(
+                        position_vec[k] + step_size * rng.standard_normal()
+                    )
+                    if new_position > 0:
+                        p = math.exp(-alpha * (new_position - position_vec[k]))
+                        if p > rng.random():
+                            position_vec[k] = new_position
+                            n_accepted += 1
+        return n_accepted
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _equilibrate_parallel_njit(
+        position_vec, alpha, equilibration_steps, step_size, rngs
+    ):
+        """
+        Multi-threaded counterpart of `_equilibrate_njit`.
+
+        Walkers are independent, so they are split into one contiguous slice per
+        generator in `rngs` and the slices are swept on separate threads, each slice
+        running all `equilibration_steps` sweeps walker by walker. Every slice draws
+        only from its own generator, so the result does not depend on how the
+        slices are scheduled. Returns the number of accepted moves.
+        """
+        numwalkers = position_vec.shape[0]
+        n_streams = len(rngs)
+        n_accepted = 0
+        for s in numba.prange(n_streams):
+            rng = rngs[s]
+            lo = s * numwalkers // n_streams
+            hi = (s + 1) * numwalkers // n_streams
+            slice_accepted = 0
+            for k in range(lo, hi):
+                position = position_vec[k]
+                for i in range(equilibration_steps):
+                    new_position = np.float32(
+                        position + step_size * rng.standard_normal()
+                    )
+                    if new_position > 0:
+                        p = math.exp(-alpha * (new_position - position))
+                        if p > rng.random():
+                            position = new_position
+                            slice_accepted += 1
+                position_vec[k] = position
+            n_accepted += slice_accepted
+        return n_accepted
+
+    _alpha_frozen_njit = numba.njit(cache=True)(_alpha_frozen)
+    _update_alpha_njit = numba.njit(fastmath=True, cache=True)(_update_alpha)
+
+    @numba.njit(fastmath=True, cache=True)
+    def _mean_inv_x_njit(x):
+        """Return ⟨1/x⟩, accumulated in double precision."""
+        sum_inv_x = 0.0
+        for k in range(x.shape[0]):
+            sum_inv_x += 1.0 / x[k]
+        return sum_inv_x / x.shape[0]
+
+    @numba.njit(fastmath=True, cache=True, nogil=True)
+    def _sample_steps_njit(
+        position_vec,
+        alpha,
+        learning_rate,
+        adam_state,
+        equilibration_steps,
+        step_size,
+        rngs,
+        alpha_buffer,
+        dE_da_buffer,
+        E_buffer,
+        start,
+        stop,
+    ):
+        """
+        Compiled counterpart of `_sample_steps_numpy`.
+
+        The whole run of sampling steps, including the alpha update and the buffer
+        writes, executes without returning to Python. A single generator in `rngs`
+        selects the serial sweep, several select the multi-threaded one.
+        """
+        for j in range(start, stop):
+            if len(rngs) > 1:
+                _equilibrate_parallel_njit(
+                    position_vec, alpha, equilibration_steps, step_size, rngs
+                )
+            else:
+                _equilibrate_njit(
+                    position_vec, alpha, equilibration_steps, step_size, rngs[0]
+                )
+            if _alpha_frozen_njit(dE_da_buffer, j):
+                dE_da = 0.0
+                mean_inv_x = _mean_inv_x_njit(position_vec)
+            else:
+                dE_da, mean_inv_x = _energy_moments_njit(position_vec, alpha)
+                alpha = _update_alpha_njit(alpha, dE_da, learning_rate, adam_state)
+            alpha_buffer[j] = alpha
+            dE_da_buffer[j] = dE_da
+            E_buffer[j] = (alpha - 1.0) * mean_inv_x - 0.5 * alpha * alpha
+        return alpha
+
+
+def _equilibrate(position_vec, alpha, equilibration_steps, step_size, rngs):
+    """
+    Run `equilibration_steps` sweeps with the kernel `metropolis` would use.
+
+    Returns the number of accepted moves.
+    """
+    if not NUMBA_AVAILABLE:
+        return _equilibrate_numpy(
+            position_vec, alpha, equilibration_steps, step_size, rngs[0]
+        )
+    if len(rngs) > 1:
+        return _equilibrate_parallel_njit(
+            position_vec, alpha, equilibration_steps, step_size, rngs
+        )
+    return _equilibrate_njit(
+        position_vec, alpha, equilibration_steps, step_size, rngs[0]
+    )
+
+
+def _tune_step_size(
+    position_vec, alpha, tuning_steps, step_size, target_acceptance, rngs
+):
+    """
+    Sweep the walkers at fixed alpha while adapting the step size, and return it.
+
+    The step size is tuned with Nesterov dual averaging. After every block of
+    `_TUNE_INTERVAL` sweeps, the running mean of `target_acceptance` minus the
+    block's acceptance rate sets the next log step size, and the weighted average
+    of those log step sizes, which settles smoothly, is returned.
+    """
+    numwalkers = len(position_vec)
+    mu = math.log(10 * step_size)
+    h_bar = 0.0
+    log_step_bar = math.log(step_size)
+    for m, start in enumerate(range(0, tuning_steps, _TUNE_INTERVAL), start=1):
+        n_sweeps = min(_TUNE_INTERVAL, tuning_steps - start)
+        n_accepted = _equilibrate(position_vec, alpha, n_sweeps, step_size, rngs)
+        acceptance = n_accepted / (n_sweeps * numwalkers)
+        h_bar += (target_acceptance - acceptance - h_bar) / (m + _DA_T0)
+        log_step = mu - math.sqrt(m) / _DA_GAMMA * h_bar
+        weight = m**-_DA_KAPPA
+        log_step_bar = weight * log_step + (1 - weight) * log_step_bar
+        step_size = math.exp(log_step)
+    return math.exp(log_step_bar)
 
 
 def metropolis(
-    equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
+    equilibration_steps,
+    numsteps,
+    numwalkers,
+    alpha,
+    learning_rate,
+    step_size,
+    progress=True,
+    seed=None,
+    target_acceptance=None,
+    optimizer="sgd",
+    init="uniform",
+    refresh_steps=None,
 ):
     """
     Perform Metropolis-Hastings sampling to optimize walker positions and the variational parameter alpha.
@@ -193,13 +710,35 @@ def metropolis(
         Step size for updating alpha.
     step_size : float
         Magnitude of the random displacements applied to walker positions during Metropolis updates.
-
+    progress : bool, optional
+        Whether to show a progress bar over the sampling steps (default: True).
+    seed : int or None, optional
+        Seed for the run's own `numpy.random.Generator`. If None (default), the
+        initial positions and the seed of the sweeps are drawn from NumPy's global
+        state.
+    target_acceptance : float or None, optional
+        If given, `step_size` is only the starting point: before sampling, the walkers
+        are swept `equilibration_steps` times at the initial alpha while the step size
+        is adapted towards this acceptance rate, and the tuned value is then kept
+        fixed. Must lie strictly between 0 and 1. None (default) disables tuning.
+    optimizer : {"sgd", "adam"}, optional
+        Update rule for alpha. "sgd" (default) takes the plain gradient step of
+        `alpha_opt_on_fly`; "adam" scales it with Adam's running gradient moments.
+    init : {"uniform", "stationary"}, optional
+        Initial walker distribution. "uniform" (default) draws positions between 2
+        and 3; "stationary" draws them from the density Ψ(x) ∝ exp(-α x) sampled at
+        the initial alpha, which requires alpha > 0.
+    refresh_steps : int or None, optional
+        Number of sweeps before each sampling step after the first. The first step
+        always performs `equilibration_steps` sweeps; later ones start from walkers
+        already equilibrated at a nearby alpha and only need to relax to the updated
+        value. None (default) repeats `equilibration_steps` sweeps at every step.
 
     Returns
     -------
     tuple
         position_vec : numpy.ndarray
-            Final walker positions after the Metropolis simulation.
+            Final walker positions after the Metropolis simulation (float32).
         alpha : float
             Final optimized value of alpha.
         alpha_buffer : numpy.ndarray
@@ -215,19 +754,66 @@ def metropolis(
     ------
     TypeError
         If any of `equilibration_steps`, `numsteps`, or `numwalkers` is not an integer.
+        If `alpha` is not a real number.
+        If `learning_rate` is not a float or int.
+        If `target_acceptance` is not None, a float or an int.
+        If `refresh_steps` is not None or an integer.
     ValueError
         If `numsteps` or `numwalkers` is less than or equal to zero.
         If `equilibration_steps` is negative.
-        If division by zero is encountered in the probability calculation.
+        If `alpha` is less than -1000 or greater than 200.
+        If `learning_rate` is negative.
+        If `target_acceptance` is not strictly between 0 and 1.
+        If `optimizer` is neither "sgd" nor "adam".
+        If `init` is neither "uniform" nor "stationary", or is "stationary" with a
+        non-positive alpha.
+        If `refresh_steps` is negative.
+        If the initial walker positions give a vanishing wavefunction, which would
+        make the acceptance ratio undefined.
 
     Notes
     -----
     - **Initialization**: Walkers are initialized with uniformly distributed positions between 2 and 3.
+      With `init="stationary"` they are drawn instead from the exponential distribution
+      with rate α that the sweeps sample, so they start in equilibrium at the initial
+      alpha and the first sweeps are not spent relaxing from [2, 3].
     - **Thermalization**: `equilibration_steps` define the number of moves performed before measurements start.
+      With `refresh_steps`, only the first sampling step performs that many sweeps and
+      the later ones perform `refresh_steps`. Fewer sweeps make the energies of
+      consecutive steps more strongly correlated, so the autocorrelation of `E_buffer`
+      should be checked when `refresh_steps` is small.
     - **Metropolis Algorithm**:
         - Each walker is displaced by adding a small Gaussian-distributed random shift.
         - The move is accepted with probability p = Ψ(new_position) / Ψ(old_position), ensuring efficient sampling.
-    - **Alpha Optimization**: After every sampling step, alpha is updated using `alpha_opt_on_fly`.
+          For the exponential trial wavefunction this ratio is evaluated directly as
+          exp(-α (new_position - old_position)), and moves to non-positive positions are rejected.
+    - **Alpha Optimization**: After every sampling step, alpha is updated with the same
+      gradient step as `alpha_opt_on_fly`, or with Adam (β1 = 0.9, β2 = 0.999) when
+      `optimizer="adam"`. Adam moves alpha by about `learning_rate` per step whatever
+      the size of the gradient, so the number of steps it needs does not depend on
+      how the learning rate compares with the gradient scale. The gradient and the mean local energy at the
+      updated alpha come from a single pass over the walkers. Once |dE/dα| has stayed
+      below 1e-6 for 10 consecutive steps, alpha is frozen: the gradient is no longer
+      computed and the remaining steps record dE/dα = 0.
+    - **Precision**: Walker positions are stored in single precision, which halves the
+      memory traffic of the sweeps. Alpha, its gradient and the energy buffer stay in
+      double precision, since they accumulate over the whole run.
+    - **Random numbers**: The sweeps draw from a `numpy.random.Generator` (PCG64).
+      With `seed=None` it is seeded from NumPy's global state, so `np.random.seed`
+      still makes runs reproducible. With an explicit `seed`, the initial positions
+      come from the same seed and the global state is left untouched.
+    - **Compiled kernel**: When numba is installed the sampling steps, including the
+      sweeps, the alpha update and the buffer writes, run in compiled code and only
+      return to Python between chunks of steps to update the progress bar. Without
+      numba, an equivalent vectorized NumPy loop is used.
+    - **Parallel sweeps**: With numba and at least 100000 walkers, the walkers are
+      split into 64 slices swept on separate threads. Each slice has its own
+      generator spawned from the same seed, so this path is reproducible through
+      `np.random.seed` too, whatever the number of threads.
+    - **Step-size tuning**: With `target_acceptance`, the step size is adapted by dual
+      averaging over blocks of 50 sweeps before sampling starts. A target of about 0.44 is optimal
+      for a one-dimensional random walk; 0.234 is the usual choice in many dimensions.
+      The tuned step size is shown in the progress bar.
     - **Typical Parameters**:
         - `numwalkers = 5000`: Large number of walkers ensures statistical accuracy.
         - `numsteps = 120`: Steps performed after equilibration.
@@ -237,53 +823,221 @@ def metropolis(
         - `step_size = 0.1`: Controls how much walkers move in each Metropolis step.
     """
 
-    if (
-        not isinstance(equilibration_steps, int)
-        or not isinstance(numsteps, int)
-        or not isinstance(numwalkers, int)
-    ):
-        raise TypeError(
-            "equilibration_steps, numsteps, and numwalkers must be integers."
-        )
+    _validate_sampling_args(
+        equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
+    )
 
-    if not isinstance(step_size, (int, float)):
-        raise TypeError("step size must be a float or an integer.")
+    if target_acceptance is not None:
+        if not isinstance(target_acceptance, (int, float)):
+            raise TypeError("target_acceptance must be a float or None.")
+        if not 0 < target_acceptance < 1:
+            raise ValueError("target_acceptance must be between 0 and 1.")
 
-    if numsteps <= 0 or numwalkers <= 0 or step_size <= 0:
-        raise ValueError(
-            "numsteps, numwalkers and step size must be positive integers greater than 0 to allow walker movement."
-        )
+    if optimizer not in ("sgd", "adam"):
+        raise ValueError("optimizer must be 'sgd' or 'adam'.")
 
-    if equilibration_steps < 0:
-        raise ValueError("equilibration_steps must be a non-negative integer.")
+    if init not in ("uniform", "stationary"):
+        raise ValueError("init must be 'uniform' or 'stationary'.")
 
-    if equilibration_steps == 0:
-        warnings.warn(
-            "equilibration_steps is set to 0. The system will not equilibrate before optimization.",
-            UserWarning,
-        )
+    if init == "stationary" and alpha <= 0:
+        raise ValueError("init='stationary' requires a positive alpha.")
+
+    if refresh_steps is not None:
+        if not isinstance(refresh_steps, int):
+            raise TypeError("refresh_steps must be an integer or None.")
+        if refresh_steps < 0:
+            raise ValueError("refresh_steps must be a non-negative integer.")
+
+    if seed is None:
+        init_rng = np.random
+        seed_seq = None
+    else:
+        init_seq, seed_seq = np.random.SeedSequence(seed).spawn(2)
+        init_rng = np.random.default_rng(init_seq)
+    if init == "stationary":
+        # Ψ(x) ∝ exp(-α x) on x > 0 is the exponential distribution with mean 1/α.
+        position_vec = init_rng.exponential(scale=1 / alpha, size=numwalkers)
+    else:
+        position_vec = init_rng.uniform(low=2, high=3, size=numwalkers)
+    if seed_seq is None:
+        seed_seq = np.random.SeedSequence(np.random.randint(0, 2**31 - 1))
 
-    position_vec = np.random.uniform(low=2, high=3, size=numwalkers)
-    initial_pos = position_vec
+    # Walkers never move to x <= 0, so this one-time check also guarantees that the
+    # energy reductions never see x = 0. Ψ(old) can only vanish here. It runs on the
+    # double-precision draw, since exp(-α x) underflows in float32 once α x > ~103.
+    if np.any(trial_wavefunction(position_vec, alpha) == 0):
+        raise ValueError("Division by zero detected in p calculation.")
+
+    position_vec = position_vec.astype(np.float32)
+    initial_pos = position_vec.copy()
     alpha_buffer = np.empty(numsteps)
     dE_da_buffer = np.empty(numsteps)
     E_buffer = np.empty(numsteps)
 
-    for j in tqdm(range(numsteps)):
-        for i in range(equilibration_steps):
-            new_position_vec = position_vec + step_size * np.random.randn(numwalkers)
-            denominator = trial_wavefunction(position_vec, alpha)
-            numerator = trial_wavefunction(new_position_vec, alpha)
-            invalid_indices = denominator == 0
-            if np.any(invalid_indices):
-                raise ValueError("Division by zero detected in p calculation.")
-            p = numerator / denominator
-            rand_unif_array = np.random.uniform(size=len(p))
-            position_vec = np.where(p > rand_unif_array, new_position_vec, position_vec)
-
-        alpha, dE_da = alpha_opt_on_fly(position_vec, alpha, learning_rate)
-        alpha_buffer[j] = alpha
-        dE_da_buffer[j] = dE_da
-        E_buffer[j] = np.mean(local_energy_func(position_vec, alpha))
+    if NUMBA_AVAILABLE and numwalkers >= _PARALLEL_MIN_WALKERS:
+        rngs = tuple(
+            np.random.default_rng(child) for child in seed_seq.spawn(_PARALLEL_STREAMS)
+        )
+    else:
+        rngs = (np.random.default_rng(seed_seq),)
+
+    if NUMBA_AVAILABLE:
+        sample_steps = _sample_steps_njit
+    else:
+        sample_steps = _sample_steps_numpy
+
+    # The steps run in chunks so that the progress bar can be updated between them.
+    chunk = max(1, numsteps // 100) if progress else numsteps
+    bounds = list(range(0, numsteps, chunk)) + [numsteps]
+    if refresh_steps is not None and bounds[1] > 1:
+        # The first step performs more sweeps than the rest, so it is a chunk of its own.
+        bounds.insert(1, 1)
+    alpha = float(alpha)
+    step_size = float(step_size)
+    adam_state = np.zeros(3 if optimizer == "adam" else 0)
+    with tqdm(total=numsteps, mininterval=1.0, disable=not progress) as bar:
+        if target_acceptance is not None:
+            step_size = _tune_step_size(
+                position_vec,
+                alpha,
+                equilibration_steps,
+                step_size,
+                target_acceptance,
+                rngs,
+            )
+            bar.set_postfix(step_size=f"{step_size:.4g}")
+        for start, stop in zip(bounds, bounds[1:]):
+            if start == 0 or refresh_steps is None:
+                sweeps = equilibration_steps
+            else:
+                sweeps = refresh_steps
+            alpha = sample_steps(
+                position_vec,
+                alpha,
+                float(learning_rate),
+                adam_state,
+                sweeps,
+                step_size,
+                rngs,
+                alpha_buffer,
+                dE_da_buffer,
+                E_buffer,
+                start,
+                stop,
+            )
+            bar.update(stop - start)
 
     return position_vec, alpha, alpha_buffer, E_buffer, dE_da_buffer, initial_pos
+
+
+def _run_one_chain(chain_args):
+    """
+    Run one seeded `metropolis` chain without a progress bar.
+
+    Defined at module level so that `multiprocessing` can pickle it.
+    """
+    seed, metropolis_args = chain_args
+    return metropolis(*metropolis_args, progress=False, seed=seed)
+
+
+def metropolis_parallel(
+    n_chains, equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
+):
+    """
+    Run independent Metropolis chains in parallel and collect their results.
+
+    Each chain is a full `metropolis` run with its own walkers and its own alpha
+    trajectory. The chains do not communicate until they finish, so the work scales
+    with the number of available cores.
+
+    Parameters
+    ----------
+    n_chains : int
+        Number of independent chains to run. Must be a positive integer.
+    equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
+        Parameters forwarded to `metropolis` for every chain.
+
+    Returns
+    -------
+    tuple
+        position_vecs : numpy.ndarray
+            Final walker positions, shape (n_chains, numwalkers).
+        alpha_fin : numpy.ndarray
+            Final optimized alpha of each chain, shape (n_chains,).
+        alpha_buffers : numpy.ndarray
+            Evolution of alpha for each chain, shape (n_chains, numsteps).
+        E_buffers : numpy.ndarray
+            Evolution of the mean local energy for each chain, shape (n_chains, numsteps).
+        E_chain_var : numpy.ndarray
+            Variance of each chain's energy buffer, shape (n_chains,).
+        E_pooled_var : float
+            Variance of all energy buffers pooled together.
+
+    Raises
+    ------
+    TypeError
+        If `n_chains` is not an integer.
+    ValueError
+        If `n_chains` is less than or equal to zero.
+
+    Notes
+    -----
+    - Chain seeds are drawn from NumPy's global generator, so `np.random.seed`
+      makes the whole set of chains reproducible. Each chain passes its seed to
+      `metropolis`, so the results do not depend on how the chains are run.
+    - With numba, the compiled sampling releases the GIL, so the chains run on
+      threads and no worker processes have to be started. Chains large enough to
+      use the multi-threaded sweep, and all chains without numba, run in separate
+      spawned processes instead, which must be able to import the calling module. At most one thread or process per CPU core is started,
+      and the remaining chains wait for a free worker.
+    - The chains run without progress bars, which would otherwise interleave.
+    - A pooled variance much larger than the per-chain variances means the chains
+      have not yet converged to the same energy.
+    """
+    if not isinstance(n_chains, int):
+        raise TypeError("n_chains must be an integer.")
+
+    if n_chains <= 0:
+        raise ValueError("n_chains must be a positive integer.")
+
+    metropolis_args = (
+        equilibration_steps,
+        numsteps,
+        numwalkers,
+        alpha,
+        learning_rate,
+        step_size,
+    )
+    seeds = np.random.randint(0, 2**31 - 1, size=n_chains)
+
+    chain_args = [(int(seed), metropolis_args) for seed in seeds]
+
+    # Invalid numwalkers fall through to the threads, where metropolis reports them.
+    multithreaded_sweeps = (
+        isinstance(numwalkers, int) and numwalkers >= _PARALLEL_MIN_WALKERS
+    )
+    # The chains are CPU-bound, so running more of them at once than there are
+    # cores only adds scheduling overhead.
+    n_workers = min(n_chains, os.cpu_count() or 1)
+    if NUMBA_AVAILABLE and not multithreaded_sweeps:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_run_one_chain, chain_args))
+    else:
+        # Forking after numba's threading layer has started can leave the workers or
+        # the interpreter hanging, so the processes are spawned instead.
+        with multiprocessing.get_context("spawn").Pool(n_workers) as pool:
+            results = pool.map(_run_one_chain, chain_args)
+
+    position_vecs = np.stack([result[0] for result in results])
+    alpha_fin = np.array([result[1] for result in results])
+    alpha_buffers = np.stack([result[2] for result in results])
+    E_buffers = np.stack([result[3] for result in results])
+
+    return (
+        position_vecs,
+        alpha_fin,
+        alpha_buffers,
+        E_buffers,
+        E_buffers.var(axis=1),
+        E_buffers.var(),
+    )
@@ -0,0 +1,171 @@
+import functools
+import numpy as np
+from vmc_simulation.simulation import _validate_sampling_args
+from vmc_simulation.simulation import metropolis_parallel
+
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError:
+    jax = None
+
+JAX_AVAILABLE = jax is not None
+
+
+if JAX_AVAILABLE:
+
+    def _run_chain(
+        key, alpha, equilibration_steps, numsteps, numwalkers, learning_rate, step_size
+    ):
+        """
+        Run one chain of `metropolis` as a pure JAX function of its random key.
+
+        The sampling steps are a `jax.lax.scan` and the sweeps within a step a
+        `jax.lax.fori_loop`, so the whole chain traces into a single XLA program.
+        """
+        key, init_key = jax.random.split(key)
+        position_vec = jax.random.uniform(
+            init_key, (numwalkers,), minval=2.0, maxval=3.0
+        )
+
+        def sampling_step(carry, _):
+            position_vec, alpha, key = carry
+
+            def sweep(_, sweep_carry):
+                position_vec, key = sweep_carry
+                key, shift_key, unif_key = jax.random.split(key, 3)
+                shift = step_size * jax.random.normal(shift_key, (numwalkers,))
+                new_position_vec = position_vec + shift
+                # Ψ(new) / Ψ(old) = exp(-α (new - old)); moves to new <= 0 are rejected.
+                p = jnp.exp(-alpha * shift)
+                accept = (new_position_vec > 0) & (
+                    p > jax.random.uniform(unif_key, (numwalkers,))
+                )
+                return jnp.where(accept, new_position_vec, position_vec), key
+
+            position_vec, key = jax.lax.fori_loop(
+                0, equilibration_steps, sweep, (position_vec, key)
+            )
+            inv_x = 1.0 / position_vec
+            El = (alpha - 1.0) * inv_x - 0.5 * alpha * alpha
+            # Centred covariance, which keeps single precision accurate.
+            dE_da = -2.0 * jnp.mean(
+                (El - jnp.mean(El)) * (position_vec - jnp.mean(position_vec))
+            )
+            alpha = alpha - learning_rate * dE_da
+            E = (alpha - 1.0) * jnp.mean(inv_x) - 0.5 * alpha * alpha
+            return (position_vec, alpha, key), (alpha, E)
+
+        (position_vec, alpha, _), (alpha_buffer, E_buffer) = jax.lax.scan(
+            sampling_step, (position_vec, alpha, key), None, length=numsteps
+        )
+        return position_vec, alpha, alpha_buffer, E_buffer
+
+    @functools.partial(jax.jit, static_argnames="shape")
+    def _run_chains(keys, alpha, learning_rate, step_size, shape):
+        """
+        Run `_run_chain` for every key with `jax.vmap`, batching the chains together.
+
+        `shape` is the static (equilibration_steps, numsteps, numwalkers) triple.
+        """
+        equilibration_steps, numsteps, numwalkers = shape
+        return jax.vmap(
+            lambda key: _run_chain(
+                key,
+                alpha,
+                equilibration_steps,
+                numsteps,
+                numwalkers,
+                learning_rate,
+                step_size,
+            )
+        )(keys)
+
+
+def metropolis_jax(
+    n_chains, equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
+):
+    """
+    Run independent Metropolis chains as one batched JAX program.
+
+    Runs the same kind of chains as `metropolis_parallel` and returns the same
+    values, but all chains are vectorized with `jax.vmap` and the sampling steps are
+    compiled into one XLA program with `jax.lax.scan`, so a GPU runs the whole
+    simulation without returning to Python.
+    This pays off once `n_chains * numwalkers` is large enough to fill the device.
+
+    Parameters
+    ----------
+    n_chains : int
+        Number of independent chains to run. Must be a positive integer.
+    equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
+        Parameters of every chain, with the same meaning as in `metropolis`.
+
+    Returns
+    -------
+    tuple
+        The same six values as `metropolis_parallel`: the final positions, final
+        alphas, alpha buffers and energy buffers of the chains, the variance of
+        each chain's energy buffer and the pooled variance.
+
+    Raises
+    ------
+    TypeError
+        If `n_chains` is not an integer, or for the invalid types listed in
+        `metropolis`.
+    ValueError
+        If `n_chains` is less than or equal to zero, or for the invalid values
+        listed in `metropolis`.
+
+    Notes
+    -----
+    - If JAX is not installed, the chains are run by `metropolis_parallel` instead.
+    - The chain keys are derived from NumPy's global generator, so `np.random.seed`
+      makes the results reproducible. They do not match `metropolis_parallel`,
+      which uses different random streams.
+    - JAX computes in single precision unless 64-bit mode is enabled. Alpha is not
+      frozen once its gradient vanishes, since skipping work does not pay off
+      inside a batched program.
+    """
+    if not JAX_AVAILABLE:
+        return metropolis_parallel(
+            n_chains,
+            equilibration_steps,
+            numsteps,
+            numwalkers,
+            alpha,
+            learning_rate,
+            step_size,
+        )
+
+    if not isinstance(n_chains, int):
+        raise TypeError("n_chains must be an integer.")
+
+    if n_chains <= 0:
+        raise ValueError("n_chains must be a positive integer.")
+
+    _validate_sampling_args(
+        equilibration_steps, numsteps, numwalkers, alpha, learning_rate, step_size
+    )
+
+    key = jax.random.PRNGKey(np.random.randint(0, 2**31 - 1))
+    keys = jax.random.split(key, n_chains)
+    position_vecs, alpha_fin, alpha_buffers, E_buffers = (
+        np.asarray(result)
+        for result in _run_chains(
+            keys,
+            float(alpha),
+            float(learning_rate),
+            float(step_size),
+            (equilibration_steps, numsteps, numwalkers),
+        )
+    )
+
+    return (
+        position_vecs,
+        alpha_fin,
+        alpha_buffers,
+        E_buffers,
+        E_buffers.var(axis=1),
+        E_buffers.var(),
+    )